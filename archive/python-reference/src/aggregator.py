@@ -1,138 +1,293 @@
-import json
+from __future__ import annotations
+
+import copy
 import os
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Any
-import argparse
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Any
+
+
+def _safe(obj):
+    """JSON fallback for Paths that slip into activity/config dicts"""
+    if isinstance(obj, Path):
+        return str(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+# Prefer orjson's C encoder; _dumps returns bytes so callers can write directly,
+# _dump_to writes to a text stream such as sys.stdout
+try:
+    import orjson
+
+    def _dumps(obj) -> bytes:
+        return orjson.dumps(obj, default=_safe,
+                            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+
+    def _dump_to(obj, out) -> None:
+        out.flush()
+        out.buffer.write(_dumps(obj))
+
+    _loads = orjson.loads
+except ImportError:
+    import json
+
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj, indent=2, default=_safe).encode('utf-8')
+
+    def _dump_to(obj, out) -> None:
+        # Stream chunks instead of materializing one big str first
+        json.dump(obj, out, indent=2, default=_safe)
+
+    _loads = json.loads
+
+# Written on first run; serialized once here rather than per missing config
+_DEFAULT_CONFIG: dict[str, Any] = {
+    "notes_root": "~/notes",
+    "output_dir": "output",
+    "projects": {
+        "quantum-dice": {
+            "path": "~/stuff/projects/quantum_dice",
+            "type": "game",
+            "active": True
+        }
+    },
+    "content_types": ["devlog", "blog", "social"]
+}
+_DEFAULT_CONFIG_BYTES = _dumps(_DEFAULT_CONFIG)
+
+# Append-only capture writes; O_CLOEXEC keeps the fd out of spawned git/ollama children
+_CAPTURE_FLAGS = os.O_WRONLY | os.O_APPEND | os.O_CREAT | getattr(os, "O_CLOEXEC", 0)
+
+
+def _append_bytes(path: str, data: bytes) -> None:
+    """Append data to path through a raw O_APPEND descriptor, retrying short writes"""
+    fd = os.open(path, _CAPTURE_FLAGS, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+def _read_text(path: str) -> str:
+    """Read a note as UTF-8 text (universal newlines); undecodable bytes become U+FFFD"""
+    with open(path, encoding='utf-8', errors='replace') as f:
+        return f.read()
+
+
+def _recent_note(entry: os.DirEntry, cutoff_ts: float) -> os.stat_result | None:
+    """Stat result for a .md file (symlinks followed) modified after cutoff_ts, else None"""
+    if not entry.name.endswith(".md") or not entry.is_file():
+        return None
+    st = entry.stat()
+    return st if st.st_mtime > cutoff_ts else None
+
 
 class ContentAggregator:
     def __init__(self, config_path="config/settings.json"):
         self.config = self._load_config(config_path)
         self.notes_root = Path(self.config.get("notes_root", "~/notes")).expanduser()
+        self._daily_dir = os.path.join(self.notes_root, "daily")
         self.projects = self._load_projects()
     
-    def _load_config(self, path: str) -> Dict:
+    def _load_config(self, path: str) -> dict[str, Any]:
         try:
-            with open(path, 'r') as f:
-                return json.load(f)
+            with open(path, 'rb') as f:
+                return _loads(f.read())
         except FileNotFoundError:
             return self._create_default_config(path)
     
-    def _create_default_config(self, path: str) -> Dict:
-        default = {
-            "notes_root": "~/notes",
-            "output_dir": "output",
-            "projects": {
-                "quantum-dice": {
-                    "path": "~/stuff/projects/quantum_dice",
-                    "type": "game",
-                    "active": True
-                }
-            },
-            "content_types": ["devlog", "blog", "social"]
-        }
-        os.makedirs(os.path.dirname(path), exist_ok=True)
-        with open(path, 'w') as f:
-            json.dump(default, f, indent=2)
-        return default
+    def _create_default_config(self, path: str) -> dict[str, Any]:
+        flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_CLOEXEC", 0)
+        try:
+            fd = os.open(path, flags, 0o644)
+        except FileNotFoundError:
+            # Only pay for makedirs when the config directory is actually missing
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            fd = os.open(path, flags, 0o644)
+        try:
+            os.write(fd, _DEFAULT_CONFIG_BYTES)
+        finally:
+            os.close(fd)
+        return copy.deepcopy(_DEFAULT_CONFIG)
     
-    def _load_projects(self) -> Dict:
-        return self.config.get("projects", {})
+    def _load_projects(self) -> dict[str, Any]:
+        projects = self.config.get("projects", {})
+        # Expand paths and filter active projects once, not on every capture/collect
+        self._project_paths = {
+            name: Path(cfg["path"]).expanduser()
+            for name, cfg in projects.items() if "path" in cfg
+        }
+        self._devlog_dirs = {
+            name: os.path.join(path, ".devlog") for name, path in self._project_paths.items()
+        }
+        self._active_projects = tuple(
+            (name, self._devlog_dirs[name]) for name in self._project_paths
+            if projects[name].get("active", False)
+        )
+        self.active_project_count = sum(1 for cfg in projects.values() if cfg.get("active", False))
+        return projects
     
-    def quick_capture(self, content: str, project: str = None, tags: List[str] = None):
+    def quick_capture(self, content: str, project: str | None = None, tags: list[str] | None = None):
         """Quick capture from command line or Cursor terminal"""
-        timestamp = datetime.now().isoformat()
+        now = datetime.now()
+        timestamp = now.isoformat()
+        capture_file = self._capture_file(project, now.strftime('%Y-%m-%d'))
         
-        # Determine capture location
-        if project and project in self.projects:
-            project_path = Path(self.projects[project]["path"]).expanduser()
-            capture_file = project_path / ".devlog" / f"{datetime.now().date()}-capture.md"
+        # Append content; untagged captures (the common case) skip the tag line entirely
+        if tags:
+            data = f"\n## {timestamp}\nTags: {', '.join(tags)}\n{content}\n".encode('utf-8')
         else:
-            capture_file = self.notes_root / "daily" / f"{datetime.now().date()}.md"
+            data = f"\n## {timestamp}\n{content}\n".encode('utf-8')
+        _append_bytes(capture_file, data)
         
-        # Ensure directory exists
-        capture_file.parent.mkdir(parents=True, exist_ok=True)
+        print(f"✅ Captured to {capture_file}")
+        return capture_file
+    
+    def quick_capture_batch(self, contents: list[str], project: str | None = None,
+                            tags: list[str] | None = None):
+        """Capture several entries with a single append (e.g. auto-captured git commits)"""
+        if not contents:
+            return None
+        now = datetime.now()
+        capture_file = self._capture_file(project, now.strftime('%Y-%m-%d'))
         
-        # Append content
-        with open(capture_file, 'a', encoding='utf-8') as f:
-            f.write(f"\n## {timestamp}\n")
-            if tags:
-                f.write(f"Tags: {', '.join(tags)}\n")
-            f.write(f"{content}\n")
+        header = f"\n## {now.isoformat()}\n"
+        if tags:
+            header += f"Tags: {', '.join(tags)}\n"
+        _append_bytes(capture_file, "".join(f"{header}{content}\n" for content in contents).encode('utf-8'))
         
-        print(f"✅ Captured to {capture_file}")
-        return str(capture_file)
+        print(f"✅ Captured {len(contents)} entries to {capture_file}")
+        return capture_file
+    
+    def _capture_file(self, project: str | None, date_str: str) -> str:
+        """Capture file for a project's devlog or the daily note, with its directory in place"""
+        capture_dir = self._devlog_dirs.get(project) if project else None
+        if capture_dir is not None:
+            capture_file = os.path.join(capture_dir, date_str + "-capture.md")
+        else:
+            capture_dir = self._daily_dir
+            capture_file = os.path.join(capture_dir, date_str + ".md")
+        os.makedirs(capture_dir, exist_ok=True)
+        return capture_file
 
-    def collect_recent_activity(self, days: int = 1) -> Dict[str, Any]:
-        """Collect recent activity across all monitored locations"""
-        cutoff = datetime.now() - timedelta(days=days)
+    def has_recent_activity(self, days: int = 1) -> bool:
+        """Whether collect_recent_activity would report anything, stopping at the first hit"""
+        cutoff_ts = (datetime.now() - timedelta(days=days)).timestamp()
+        dirs = [(self._daily_dir, False)]
+        dirs.extend((devlog_dir, True) for _, devlog_dir in self._active_projects)
+        for directory, is_devlog in dirs:
+            try:
+                entries = os.scandir(directory)
+            except (FileNotFoundError, NotADirectoryError):
+                continue
+            with entries:
+                for entry in entries:
+                    # A devlog README alone is reported as project context
+                    if is_devlog and entry.name == "README.md" and entry.is_file():
+                        return True
+                    if _recent_note(entry, cutoff_ts) is not None:
+                        return True
+        return False
+    
+    def collect_recent_activity(self, days: int = 1, include_content: bool = True) -> dict[str, Any]:
+        """Collect recent activity across all monitored locations (metadata only unless include_content)"""
+        now = datetime.now()
+        cutoff_ts = (now - timedelta(days=days)).timestamp()
         activity = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": now.isoformat(),
             "daily_notes": [],  # PRIORITY: Put daily notes first
             "projects": {},
             "raw_captures": []
         }
         
         # PRIORITY 1: Collect daily notes FIRST (most recent captures)
-        daily_dir = self.notes_root / "daily"
-        if daily_dir.exists():
-            for note_file in daily_dir.glob("*.md"):
-                if datetime.fromtimestamp(note_file.stat().st_mtime) > cutoff:
-                    content = note_file.read_text(encoding='utf-8')
-                    activity["daily_notes"].append({
-                        "file": str(note_file),
-                        "content": content,
-                        "priority": "high",  # Mark as high priority
-                        "type": "recent_capture"  # Explicit type
-                    })
+        activity["daily_notes"] = self._collect_daily_notes(cutoff_ts, include_content)
         
         # PRIORITY 2: Collect from active projects (older devlogs)
-        for project_name, project_config in self.projects.items():
-            if not project_config.get("active", False):
-                continue
-                
-            project_path = Path(project_config["path"]).expanduser()
-            project_activity = self._collect_project_activity(project_path, cutoff)
+        for project_name, devlog_dir in self._active_projects:
+            project_activity = self._collect_project_activity(
+                self._project_paths[project_name], cutoff_ts, include_content, devlog_dir)
             if project_activity:
                 activity["projects"][project_name] = project_activity
         
         return activity
     
-    def _collect_project_activity(self, project_path: Path, cutoff: datetime) -> Dict:
+    def _collect_daily_notes(self, cutoff_ts: float, include_content: bool) -> list[dict[str, Any]]:
+        """Collect recent daily notes"""
+        notes = []
+        try:
+            entries = os.scandir(self._daily_dir)
+        except (FileNotFoundError, NotADirectoryError):
+            return notes
+        with entries:
+            for entry in entries:
+                st = _recent_note(entry, cutoff_ts)
+                if st is None:
+                    continue
+                note = {
+                    "file": entry.path,
+                    "size": st.st_size,
+                    "mtime": st.st_mtime,
+                    "priority": "high",  # Mark as high priority
+                    "type": "recent_capture"  # Explicit type
+                }
+                if include_content:
+                    note["content"] = _read_text(entry.path)
+                notes.append(note)
+        return notes
+    
+    def _collect_project_activity(self, project_path: Path, cutoff_ts: float,
+                                  include_content: bool = True,
+                                  devlog_dir: str | None = None) -> dict[str, Any]:
         """Collect activity from a specific project"""
         activity = {}
         
         # Check for devlog entries
-        devlog_dir = project_path / ".devlog"
-        if devlog_dir.exists():
+        if devlog_dir is None:
+            devlog_dir = os.path.join(project_path, ".devlog")
+        try:
+            entries = os.scandir(devlog_dir)
+        except (FileNotFoundError, NotADirectoryError):
+            entries = None
+        if entries is not None:
             recent_logs = []
-            for log_file in devlog_dir.glob("*.md"):
-                if log_file.name == "README.md":
-                    # Skip README, handle separately
-                    continue
-                if datetime.fromtimestamp(log_file.stat().st_mtime) > cutoff:
-                    recent_logs.append({
-                        "file": str(log_file),
-                        "content": log_file.read_text(encoding='utf-8')
-                    })
+            readme = None
+            with entries:
+                for entry in entries:
+                    if entry.name == "README.md":
+                        # Note the README from the same listing, handle separately
+                        if entry.is_file():
+                            readme = entry
+                        continue
+                    st = _recent_note(entry, cutoff_ts)
+                    if st is not None:
+                        log = {"file": entry.path, "size": st.st_size, "mtime": st.st_mtime}
+                        if include_content:
+                            log["content"] = _read_text(entry.path)
+                        recent_logs.append(log)
             if recent_logs:
                 activity["devlog"] = recent_logs
             
             # Load project context from README if available
-            readme_file = devlog_dir / "README.md"
-            if readme_file.exists():
-                activity["context"] = {
-                    "file": str(readme_file),
-                    "content": readme_file.read_text(encoding='utf-8')
-                }
+            if readme is not None:
+                activity["context"] = {"file": readme.path}
+                if include_content:
+                    activity["context"]["content"] = _read_text(readme.path)
         
         # TODO: Add git activity collection
         # TODO: Add file change detection
         
         return activity
 
+
 # CLI interface for quick testing
-if __name__ == "__main__":
+def _main():
+    import argparse
     import sys
     
     parser = argparse.ArgumentParser(description="Content Pipeline Aggregator")
@@ -163,4 +318,10 @@ if __name__ == "__main__":
     
     elif args.command == "collect":
         activity = aggregator.collect_recent_activity(days=args.days)
-        print(json.dumps(activity, indent=2)) 
\ No newline at end of file
+        _dump_to(activity, sys.stdout)
+        sys.stdout.write("\n")
+        sys.stdout.flush()
+
+
+if __name__ == "__main__":
+    _main()
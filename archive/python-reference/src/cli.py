@@ -4,47 +4,194 @@ uroboro - The Self-Documenting Content Pipeline
 North Star CLI - 3 core commands only
 """
 
+from __future__ import annotations
+
 import argparse
+import functools
+import re
 import sys
-from pathlib import Path
-import json
-from datetime import datetime
 
-# Import existing modules
-from .aggregator import ContentAggregator
-from .processors.content_generator import ContentGenerator
-from .git_integration import GitIntegration
+# Project modules are imported on first use (_aggregator, _git, command bodies) so
+# `uro --help` and quick captures don't pay for the generator/git import graph
+
+# Keyword families for follow-up questions, matched at word starts so "fixed"/"added" still count
+_FIX_RE = re.compile(r"\b(?:fix|bug|error|issue)")
+_IMPL_RE = re.compile(r"\b(?:implement|add|create|build)")
+_PERF_RE = re.compile(r"\b(?:optimize|improve|performance)")
+
+# Conventional commit prefixes and the type they map to, matched in one case-insensitive regex
+_PREFIX_MAP = {
+    'feat': 'feat',
+    'feature': 'feat',
+    'fix': 'fix',
+    'refactor': 'refactor',
+    'docs': 'docs',
+    'test': 'test',
+    'style': 'style',
+    'perf': 'perf',
+}
+_CC_RE = re.compile(r"(%s):" % "|".join(_PREFIX_MAP), re.IGNORECASE)
+
+# Follow-up questions, by conventional commit type and by keyword family
+_QUESTIONS_BY_TYPE = {
+    'feat': (
+        "What user problem does this solve?",
+        "What's the key user benefit?",
+        "What's the next enhancement?",
+        "How will users discover this?"
+    ),
+    'fix': (
+        "What was the root cause?",
+        "How did you discover this bug?",
+        "What's the user impact?",
+        "How can this be prevented?"
+    ),
+    'refactor': (
+        "What was the technical debt?",
+        "What's cleaner/better now?",
+        "What risk did this reduce?",
+        "What does this enable next?"
+    ),
+    'docs': (
+        "What was unclear before?",
+        "Who will benefit from this?",
+        "What examples help most?",
+        "What questions does this answer?"
+    ),
+    'test': (
+        "What edge case does this cover?",
+        "What bug could this catch?",
+        "How much confidence does this add?",
+        "What scenario worried you?"
+    ),
+    'perf': (
+        "What metrics improved?",
+        "What was the bottleneck?",
+        "How much faster/better?",
+        "What's the user impact?"
+    ),
+    'style': (
+        "What's more consistent now?",
+        "What standard does this follow?",
+        "What's easier to read?",
+        "What confusion does this prevent?"
+    )
+}
+_FIX_QUESTIONS = (
+    "What was the root cause?",
+    "How did you discover this?",
+    "What's the impact/scope?"
+)
+_IMPL_QUESTIONS = (
+    "What problem does this solve?",
+    "What was the key insight?",
+    "What's the next step?"
+)
+_PERF_QUESTIONS = (
+    "What metrics improved?",
+    "What was the bottleneck?",
+    "How much faster/better?"
+)
+_GENERAL_QUESTIONS = (
+    "What was the main challenge?",
+    "What did you learn?",
+    "What's the impact?",
+    "What would you do differently?",
+    "What's next?"
+)
+
+# Capture headers written by quick_capture: "## <ISO timestamp>"
+_CAPTURE_HDR_RE = re.compile(r"## \d{4}-\d{2}-\d{2}T")
+
+# Publishable content types, in the order `publish --type all` renders them
+_PUBLISH_TYPES = ("blog", "social", "devlog")
+_PUBLISH_CHOICES = (*_PUBLISH_TYPES, "all")
+_PUBLISH_PROGRESS = {
+    "blog": "📝 Generating blog post...",
+    "social": "📱 Generating social media content...",
+    "devlog": "📋 Generating development log...",
+}
+
+# Voices passed to the generator when publish has to pick one itself
+_VOICE_DETECTED = "personal_detected"
+_VOICE_DEFAULT = "professional"
+
+# How capture timestamps are shown by `status --recent`
+_CAPTURE_TIME_FMT = "%b %d, %H:%M"
+
+# Shown ahead of the argparse help when uro is run without a command
+_NO_COMMAND_BANNER = """\
+🐍 uroboro - The Self-Documenting Content Pipeline
+🧪 EXPERIMENTAL BRANCH - Features being tested
+
+🎯 North Star Workflow (3 commands, that's it):
+  uro capture 'Fixed database timeout - cut query time from 3s to 200ms'
+  uro publish --blog
+  uro status
+
+🧪 Experimental features:
+  uro capture 'content' --qa 2  # Interactive follow-up questions
+
+Get acknowledged for your actual work. 🔥
+"""
+
+
+@functools.lru_cache(maxsize=None)
+def _aggregator():
+    """Shared ContentAggregator for this process, built on first use"""
+    from .aggregator import ContentAggregator
+    return ContentAggregator()
+
+
+@functools.lru_cache(maxsize=None)
+def _git():
+    """Shared GitIntegration for the current directory, built on first use"""
+    from .git_integration import GitIntegration
+    return GitIntegration()
+
+
+def _error(message: str) -> None:
+    """Report an error on stderr, after any stdout output already printed"""
+    sys.stdout.flush()
+    sys.stderr.write(message + "\n")
 
 
 def cmd_capture(args):
     """Handle capture - the 10-second insight capture"""
     try:
-        aggregator = ContentAggregator()
-        content = " ".join(args.content)
+        aggregator = _aggregator()
+        # A single quoted argument is the common case; don't rebuild it
+        content = args.content[0] if len(args.content) == 1 else " ".join(args.content)
         
         # Auto git integration - capture recent commits if in git repo
         if args.auto_git:
             try:
-                git = GitIntegration()
-                recent_commits = git.get_recent_commits(days=1)
+                recent_commits = _git().get_recent_commits(days=1)
                 if recent_commits:
                     print(f"🔗 Auto-captured {len(recent_commits)} recent commits")
+                    git_entries = []
                     for commit in recent_commits:
-                        git_content = f"Commit: {commit['message']} (files: {', '.join(commit['files'][:3])})"
-                        aggregator.quick_capture(git_content, project=args.project, tags=['git'])
+                        files = commit.get('files') or ()
+                        git_content = f"Commit: {commit['message']}"
+                        if files:
+                            git_content += f" (files: {', '.join(files[:3])})"
+                        git_entries.append(git_content)
+                    aggregator.quick_capture_batch(git_entries, project=args.project, tags=['git'])
             except Exception:
                 pass  # Git integration is optional
         
         # EXPERIMENTAL: Interactive QA enhancement
         enhanced_content = content
-        if hasattr(args, 'qa') and args.qa:
+        if args.qa:
             enhanced_content = _enhance_capture_with_qa(content, args.qa)
         
         aggregator.quick_capture(enhanced_content, project=args.project, tags=args.tags)
-        print(f"✅ Captured: {enhanced_content[:60]}{'...' if len(enhanced_content) > 60 else ''}")
+        preview = enhanced_content if len(enhanced_content) <= 60 else enhanced_content[:60] + "..."
+        print(f"✅ Captured: {preview}")
         
     except Exception as e:
-        print(f"❌ Capture failed: {e}")
+        _error(f"❌ Capture failed: {e}")
+        sys.exit(1)
 
 
 def _enhance_capture_with_qa(content: str, num_questions: int) -> str:
@@ -53,6 +200,10 @@ def _enhance_capture_with_qa(content: str, num_questions: int) -> str:
         print("⚠️  QA questions limited to 1-3")
         return content
     
+    if not sys.stdin.isatty():
+        print("⚠️  --qa needs an interactive terminal; skipping questions")
+        return content
+    
     print(f"\n🤔 {num_questions} quick question(s) to enhance your capture:")
     print(f"📝 Original: {content}")
     
@@ -68,7 +219,7 @@ def _enhance_capture_with_qa(content: str, num_questions: int) -> str:
                 enhanced_parts.append(answer)
             else:
                 print("   (skipped)")
-        except KeyboardInterrupt:
+        except (KeyboardInterrupt, EOFError):
             print("\n⏭️  Skipping remaining questions")
             break
     
@@ -79,150 +230,66 @@ def _enhance_capture_with_qa(content: str, num_questions: int) -> str:
     return content
 
 
-def _get_smart_questions(content: str, num_questions: int) -> list:
+def _get_smart_questions(content: str, num_questions: int) -> tuple:
     """Generate smart follow-up questions based on capture content"""
-    content_lower = content.lower()
-    available_questions = []
-    
     # Check for conventional commit patterns first
     commit_type = _detect_commit_type(content)
     if commit_type:
-        available_questions.extend(_get_commit_type_questions(commit_type))
+        return _get_commit_type_questions(commit_type)[:num_questions]
     
-    # Context-aware question suggestions (fallback if no commit type)
-    if not available_questions:
-        if any(word in content_lower for word in ['fix', 'bug', 'error', 'issue']):
-            available_questions.extend([
-                "What was the root cause?",
-                "How did you discover this?",
-                "What's the impact/scope?"
-            ])
-        
-        if any(word in content_lower for word in ['implement', 'add', 'create', 'build']):
-            available_questions.extend([
-                "What problem does this solve?",
-                "What was the key insight?",
-                "What's the next step?"
-            ])
-        
-        if any(word in content_lower for word in ['optimize', 'improve', 'performance']):
-            available_questions.extend([
-                "What metrics improved?",
-                "What was the bottleneck?", 
-                "How much faster/better?"
-            ])
+    # Context-aware question suggestions (fallback if no commit type); the sets are disjoint
+    content_lower = content.lower()
+    selected = ()
+    if _FIX_RE.search(content_lower):
+        selected += _FIX_QUESTIONS
+    if _IMPL_RE.search(content_lower):
+        selected += _IMPL_QUESTIONS
+    if _PERF_RE.search(content_lower):
+        selected += _PERF_QUESTIONS
     
     # Fallback general questions
-    if not available_questions:
-        available_questions = [
-            "What was the main challenge?",
-            "What did you learn?",
-            "What's the impact?",
-            "What would you do differently?",
-            "What's next?"
-        ]
-    
-    # Return up to num_questions, avoiding duplicates
-    return list(dict.fromkeys(available_questions))[:num_questions]
+    return (selected or _GENERAL_QUESTIONS)[:num_questions]
 
 
 def _detect_commit_type(content: str) -> str:
     """Detect conventional commit type from content"""
-    content_lower = content.lower()
-    
     # Direct conventional commit patterns
-    if content_lower.startswith('feat:') or content_lower.startswith('feature:'):
-        return 'feat'
-    elif content_lower.startswith('fix:'):
-        return 'fix'
-    elif content_lower.startswith('refactor:'):
-        return 'refactor'
-    elif content_lower.startswith('docs:'):
-        return 'docs'
-    elif content_lower.startswith('test:'):
-        return 'test'
-    elif content_lower.startswith('style:'):
-        return 'style'
-    elif content_lower.startswith('perf:'):
-        return 'perf'
+    match = _CC_RE.match(content)
+    if match:
+        return _PREFIX_MAP[match.group(1).lower()]
     
     # Infer from git commit context
-    if 'git commit:' in content_lower:
+    content_lower = content.lower()
+    marker = content_lower.find('git commit:')
+    if marker != -1:
         # Extract the actual commit message
-        if 'git commit:' in content_lower:
-            commit_msg = content.split('git commit:', 1)[1].strip()
-            return _detect_commit_type(commit_msg)
+        return _detect_commit_type(content_lower[marker + len('git commit:'):].strip())
     
     return None
 
 
-def _get_commit_type_questions(commit_type: str) -> list:
+def _get_commit_type_questions(commit_type: str) -> tuple:
     """Get targeted questions based on conventional commit type"""
-    questions_by_type = {
-        'feat': [
-            "What user problem does this solve?",
-            "What's the key user benefit?",
-            "What's the next enhancement?",
-            "How will users discover this?"
-        ],
-        'fix': [
-            "What was the root cause?",
-            "How did you discover this bug?",
-            "What's the user impact?",
-            "How can this be prevented?"
-        ],
-        'refactor': [
-            "What was the technical debt?",
-            "What's cleaner/better now?",
-            "What risk did this reduce?",
-            "What does this enable next?"
-        ],
-        'docs': [
-            "What was unclear before?",
-            "Who will benefit from this?",
-            "What examples help most?",
-            "What questions does this answer?"
-        ],
-        'test': [
-            "What edge case does this cover?",
-            "What bug could this catch?",
-            "How much confidence does this add?",
-            "What scenario worried you?"
-        ],
-        'perf': [
-            "What metrics improved?",
-            "What was the bottleneck?",
-            "How much faster/better?",
-            "What's the user impact?"
-        ],
-        'style': [
-            "What's more consistent now?",
-            "What standard does this follow?",
-            "What's easier to read?",
-            "What confusion does this prevent?"
-        ]
-    }
-    
-    return questions_by_type.get(commit_type, [])
+    return _QUESTIONS_BY_TYPE.get(commit_type, ())
 
 
 def cmd_publish(args):
     """Handle publish - generate and publish professional content"""
     try:
         print(f"🔍 Collecting activity from last {args.days} day(s)...")
-        aggregator = ContentAggregator()
-        activity = aggregator.collect_recent_activity(days=args.days)
+        aggregator = _aggregator()
         
-        # Check if we have any content
-        total_items = len(activity.get("projects", {})) + len(activity.get("daily_notes", []))
-        if total_items == 0:
+        # Check if we have any content before paying for the full scan and note reads
+        if not aggregator.has_recent_activity(days=args.days):
             print("❌ No recent activity found to process")
             print("💡 Try: uro capture 'your development insight' first")
             return
+        activity = aggregator.collect_recent_activity(days=args.days)
         
         print(f"✅ Found activity from {len(activity.get('projects', {}))} projects")
         
-        generator = ContentGenerator()
+        from .processors.content_generator import get_default_generator
+        generator = get_default_generator()
         
         # Auto-mine knowledge if requested or if deep mode
         if args.deep or args.mine:
@@ -236,137 +303,147 @@ def cmd_publish(args):
                 # Integrate knowledge mining into activity
                 activity['knowledge_insights'] = knowledge_analysis
             except Exception as e:
-                print(f"⚠️ Knowledge mining failed: {e}")
+                _error(f"⚠️ Knowledge mining failed: {e}")
         
         # Auto-detect voice if not specified
-        if not args.voice:
+        voice = args.voice
+        if not voice:
             print("🎤 Auto-detecting your writing voice...")
             try:
                 from .voice_analyzer import VoiceAnalyzer
                 analyzer = VoiceAnalyzer(".")  # Analyze current directory
-                voice_profile = analyzer.analyze_notes()
-                args.voice = "personal_detected"
-                print(f"✅ Detected voice: {voice_profile.get('style', 'professional')}")
+                style = analyzer.analyze_notes().get('style', _VOICE_DEFAULT)
+                voice = _VOICE_DETECTED
+                print(f"✅ Detected voice: {style}")
             except Exception:
-                args.voice = "professional"  # Fallback
+                voice = _VOICE_DEFAULT  # Fallback
         
-        # Generate content based on type
-        if args.type == "blog":
-            print("📝 Generating blog post...")
-            content = generator.generate_blog_post(
-                activity, 
-                title=args.title, 
-                tags=args.tags, 
-                format=args.format, 
-                voice=args.voice
-            )
-            
-            if args.preview:
-                generator.enhanced_preview_content(content, "blog")
-            else:
-                saved_path = generator.save_blog_post(content, format=args.format)
-                print(f"✅ Blog post saved to: {saved_path}")
+        # Generate content based on type; "all" produces every type
+        content_types = _PUBLISH_TYPES if args.type == "all" else (args.type,)
+        jobs = {
+            "blog": functools.partial(generator.generate_blog_post, activity, title=args.title,
+                                      tags=args.tags, format=args.format, voice=voice),
+            "social": functools.partial(generator.create_social_hooks, activity, voice=voice),
+            "devlog": functools.partial(generator.generate_devlog_summary, activity),
+        }
+        if len(content_types) == 1 or not args.parallel:
+            results = {}
+            for content_type in content_types:
+                print(_PUBLISH_PROGRESS[content_type])
+                results[content_type] = jobs[content_type]()
+        else:
+            for content_type in content_types:
+                print(_PUBLISH_PROGRESS[content_type])
+            # Each type is an independent LLM round-trip; overlap them and render in order below
+            from concurrent.futures import ThreadPoolExecutor
+            with ThreadPoolExecutor(max_workers=len(content_types)) as pool:
+                futures = {content_type: pool.submit(jobs[content_type]) for content_type in content_types}
+            results = {content_type: future.result() for content_type, future in futures.items()}
         
-        elif args.type == "social":
-            print("📱 Generating social media content...")
-            social_hooks = generator.create_social_hooks(activity, voice=args.voice)
-            
-            print("--- SOCIAL HOOKS ---")
-            for i, hook in enumerate(social_hooks, 1):
-                print(f"{i}. {hook}")
-            print("--- END SOCIAL HOOKS ---")
-        
-        elif args.type == "devlog":
-            print("📋 Generating development log...")
-            devlog = generator.generate_devlog_summary(activity)
-            
-            if args.preview:
-                generator.enhanced_preview_content(devlog, "devlog")
-            else:
-                print("--- DEVLOG SUMMARY ---")
-                print(devlog)
-                print("--- END DEVLOG ---")
+        for content_type in content_types:
+            _PUBLISH_RENDERERS[content_type](generator, results[content_type], args)
         
     except Exception as e:
-        print(f"❌ Publish failed: {e}")
+        _error(f"❌ Publish failed: {e}")
+        sys.exit(1)
+
+
+def _render_blog(generator, content, args):
+    """Preview or save a generated blog post"""
+    if args.preview:
+        generator.enhanced_preview_content(content, "blog")
+    else:
+        saved_path = generator.save_blog_post(content, format=args.format)
+        print(f"✅ Blog post saved to: {saved_path}")
+
+
+def _render_social(generator, hooks, args):
+    """Print generated social hooks as a numbered list"""
+    hooks = "".join(f"{i}. {hook}\n" for i, hook in enumerate(hooks, 1))
+    sys.stdout.write(f"--- SOCIAL HOOKS ---\n{hooks}--- END SOCIAL HOOKS ---\n")
+
+
+def _render_devlog(generator, devlog, args):
+    """Preview or print a generated devlog summary"""
+    if args.preview:
+        generator.enhanced_preview_content(devlog, "devlog")
+    else:
+        sys.stdout.write(f"--- DEVLOG SUMMARY ---\n{devlog}\n--- END DEVLOG ---\n")
+
+
+# Content type -> function presenting its generated result
+_PUBLISH_RENDERERS = {
+    "blog": _render_blog,
+    "social": _render_social,
+    "devlog": _render_devlog,
+}
 
 
 def cmd_status(args):
     """Show uroboro status - everything you need to know"""
     try:
-        aggregator = ContentAggregator()
+        aggregator = _aggregator()
         
         # Core status
         print("🐍 uroboro status")
         print(f"Notes root: {aggregator.notes_root}")
-        print(f"Active projects: {len([p for p in aggregator.projects.values() if p.get('active', False)])}")
+        print(f"Active projects: {aggregator.active_project_count}")
+        
+        # Activity, git and voice lookups are independent and I/O bound; overlap them
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            # Counts only need file metadata; note bodies are read just for --recent
+            activity_future = pool.submit(aggregator.collect_recent_activity, days=args.days,
+                                          include_content=args.recent)
+            git_future = pool.submit(_recent_commits, args.days)
+            voice_future = pool.submit(_analyze_voice)
         
         # Recent activity
-        activity = aggregator.collect_recent_activity(days=args.days)
-        total_items = len(activity.get("projects", {})) + len(activity.get("daily_notes", []))
+        activity = activity_future.result()
+        projects = activity.get("projects") or {}
+        total_items = len(projects) + len(activity.get("daily_notes", ()))
         print(f"Recent activity ({args.days} days): {total_items} items")
         
-        if args.verbose:
-            for project, data in activity.get("projects", {}).items():
-                print(f"  📁 {project}: {len(data.get('devlog', []))} devlog entries")
+        if args.verbose and projects:
+            for project, data in projects.items():
+                print(f"  📁 {project}: {len(data.get('devlog', ()))} devlog entries")
         
         # Show recent capture content if requested
-        if hasattr(args, 'recent') and args.recent:
-            print(f"\n📝 Recent Captures (last {args.days} days):")
-            captures_shown = 0
+        if args.recent:
+            from datetime import datetime
+            from itertools import islice
+            # The generator stops parsing notes once the first 10 captures are in hand
+            captures = list(islice(_iter_recent_captures(activity.get("daily_notes", [])), 10))
             
-            # Parse daily notes for captures
-            for daily_note in activity.get("daily_notes", []):
-                content = daily_note.get("content", "")
-                lines = content.split('\n')
-                
-                for i, line in enumerate(lines):
-                    if line.startswith('## ') and 'T' in line:  # Timestamp marker
-                        # Extract timestamp and capture content
-                        timestamp = line.replace('## ', '').strip()
-                        capture_content = []
-                        j = i + 1
-                        
-                        # Collect content until next timestamp or end
-                        while j < len(lines) and not lines[j].startswith('## '):
-                            if lines[j].strip():  # Skip empty lines
-                                capture_content.append(lines[j])
-                            j += 1
-                        
-                        if capture_content:
-                            # Format timestamp for display
-                            try:
-                                dt = datetime.fromisoformat(timestamp)
-                                friendly_time = dt.strftime("%b %d, %H:%M")
-                            except:
-                                friendly_time = timestamp
-                            
-                            print(f"  🕐 {friendly_time}")
-                            for content_line in capture_content[:3]:  # Show first 3 lines max
-                                if content_line.startswith('Tags:'):
-                                    print(f"    🏷️  {content_line}")
-                                else:
-                                    print(f"    📄 {content_line.strip()}")
-                            if len(capture_content) > 3:
-                                print(f"    ... ({len(capture_content) - 3} more lines)")
-                            print()
-                            
-                            captures_shown += 1
-                            if captures_shown >= 10:  # Limit to 10 most recent
-                                break
+            # Build the whole section and write it once rather than a print per line
+            out = [f"\n📝 Recent Captures (last {args.days} days):"]
+            fromisoformat = datetime.fromisoformat
+            for timestamp, capture_content in captures:
+                # Format timestamp for display
+                try:
+                    friendly_time = fromisoformat(timestamp).strftime(_CAPTURE_TIME_FMT)
+                except ValueError:
+                    friendly_time = timestamp
                 
-                if captures_shown >= 10:
-                    break
+                out.append(f"  🕐 {friendly_time}")
+                for content_line in capture_content[:3]:  # Show first 3 lines max
+                    if content_line.startswith('Tags:'):
+                        out.append(f"    🏷️  {content_line}")
+                    else:
+                        out.append(f"    📄 {content_line.strip()}")
+                if len(capture_content) > 3:
+                    out.append(f"    ... ({len(capture_content) - 3} more lines)")
+                out.append("")
             
-            if captures_shown == 0:
-                print("  No recent captures found")
-            elif captures_shown == 10:
-                print(f"  (Showing 10 most recent captures)")
+            if not captures:
+                out.append("  No recent captures found")
+            elif len(captures) == 10:
+                out.append("  (Showing 10 most recent captures)")
+            sys.stdout.write("\n".join(out) + "\n")
         
         # Git status (if in git repo)
         try:
-            git = GitIntegration()
-            recent_commits = git.get_recent_commits(days=args.days)
+            recent_commits = git_future.result()
             print(f"Git commits ({args.days} days): {len(recent_commits)}")
             if args.verbose and recent_commits:
                 for commit in recent_commits[:3]:  # Show latest 3
@@ -374,45 +451,72 @@ def cmd_status(args):
         except Exception:
             print("Git status: Not a git repository")
         
-        # Voice status
+        # Voice status - analyze once and reuse the analyzer for --analyze-voice
         print("\n🎤 Voice Profile Status:")
+        voice_error = None
         try:
-            from .voice_analyzer import VoiceAnalyzer
-            analyzer = VoiceAnalyzer(".")
-            voice_profile = analyzer.analyze_notes()
+            analyzer, voice_profile = voice_future.result()
             print(f"  Style: {voice_profile.get('style', 'Not analyzed')}")
             print(f"  Sentences analyzed: {voice_profile.get('sentence_count', 0)}")
             print(f"  Avg sentence length: {voice_profile.get('avg_sentence_length', 0):.1f} words")
-        except Exception:
+        except Exception as e:
+            voice_error = e
             print("  Status: Voice not analyzed yet (run with --analyze-voice)")
         
         # Analyze voice if requested
         if args.analyze_voice:
             print("\n🎤 Analyzing voice patterns...")
-            try:
-                from .voice_analyzer import VoiceAnalyzer
-                analyzer = VoiceAnalyzer(".")
-                voice_profile = analyzer.analyze_notes()
-                analyzer.save_profile()
-                print("✅ Voice analysis complete and saved")
-            except Exception as e:
-                print(f"❌ Voice analysis failed: {e}")
+            if voice_error is not None:
+                _error(f"❌ Voice analysis failed: {voice_error}")
+            else:
+                try:
+                    analyzer.save_profile()
+                    print("✅ Voice analysis complete and saved")
+                except Exception as e:
+                    _error(f"❌ Voice analysis failed: {e}")
         
     except Exception as e:
-        print(f"❌ Status check failed: {e}")
+        _error(f"❌ Status check failed: {e}")
+        sys.exit(1)
 
 
-def main():
-    """Main CLI entry point - North Star simplicity"""
-    parser = argparse.ArgumentParser(
-        prog="uroboro",
-        description="The Self-Documenting Content Pipeline",
-        epilog="Three commands. That's it. 🎯"
-    )
-    
-    subparsers = parser.add_subparsers(dest='command', help='Core commands')
-    
-    # CAPTURE - 10-second insight capture
+def _iter_recent_captures(daily_notes: list):
+    """Yield (timestamp, non-empty lines) for each capture block in the daily notes"""
+    for daily_note in daily_notes:
+        lines = daily_note.get("content", "").splitlines()
+        lines.append('## ')  # Sentinel header flushes the last capture
+        timestamp = None
+        capture_content = []
+        
+        for line in lines:
+            if not line.startswith('## '):
+                # Collect content until next header, skipping empty lines
+                if timestamp is not None and line.strip():
+                    capture_content.append(line)
+                continue
+            
+            if capture_content:
+                yield timestamp, capture_content
+            
+            # Only timestamped headers start a capture
+            timestamp = line[3:].strip() if _CAPTURE_HDR_RE.match(line) else None
+            capture_content = []
+
+
+def _recent_commits(days: int) -> list:
+    """Recent commits in the current directory's repo, for status"""
+    return _git().get_recent_commits(days=days)
+
+
+def _analyze_voice() -> tuple:
+    """Analyze notes under the current directory, returning (analyzer, profile)"""
+    from .voice_analyzer import VoiceAnalyzer
+    analyzer = VoiceAnalyzer(".")
+    return analyzer, analyzer.analyze_notes()
+
+
+def _add_capture_parser(subparsers):
+    """CAPTURE - 10-second insight capture"""
     capture_parser = subparsers.add_parser('capture', 
                                          help='Capture development insights (10 seconds)')
     capture_parser.add_argument('content', nargs='+', help='Your development insight')
@@ -422,11 +526,14 @@ def main():
                                help='Auto-capture recent git commits')
     capture_parser.add_argument('--qa', type=int, metavar='N', 
                                help='[EXPERIMENTAL] Ask N follow-up questions (1-3) to enhance capture')
-    
-    # PUBLISH - generate professional content 
+    capture_parser.set_defaults(func=cmd_capture)
+
+
+def _add_publish_parser(subparsers):
+    """PUBLISH - generate professional content"""
     publish_parser = subparsers.add_parser('publish',
                                          help='Generate professional content (2 minutes)')
-    publish_parser.add_argument('--type', choices=["blog", "social", "devlog"], 
+    publish_parser.add_argument('--type', choices=_PUBLISH_CHOICES, 
                                default="blog", help='Content type to generate')
     publish_parser.add_argument('--days', '-d', type=int, default=7, 
                                help='Days of activity to include')
@@ -441,8 +548,13 @@ def main():
                                help='Deep analysis with knowledge mining')
     publish_parser.add_argument('--mine', action='store_true',
                                help='Include knowledge base insights')
-    
-    # STATUS - see everything important
+    publish_parser.add_argument('--parallel', action='store_true',
+                               help='With --type all, generate the content types concurrently')
+    publish_parser.set_defaults(func=cmd_publish)
+
+
+def _add_status_parser(subparsers):
+    """STATUS - see everything important"""
     status_parser = subparsers.add_parser('status', 
                                         help='Show status and recent activity')
     status_parser.add_argument('--days', '-d', type=int, default=7, 
@@ -453,48 +565,73 @@ def main():
                               help='Analyze and update voice profile')
     status_parser.add_argument('--recent', action='store_true',
                               help='Show recent captures')
+    status_parser.set_defaults(func=cmd_status)
+
+
+# Subcommand name -> function registering its parser, in help order
+_PARSER_BUILDERS = {
+    'capture': _add_capture_parser,
+    'publish': _add_publish_parser,
+    'status': _add_status_parser,
+}
+
+
+def _build_parser(command: str | None) -> argparse.ArgumentParser:
+    """Build the CLI parser for one subcommand (None builds every subcommand)"""
+    parser = argparse.ArgumentParser(
+        prog="uroboro",
+        description="The Self-Documenting Content Pipeline",
+        epilog="Three commands. That's it. 🎯"
+    )
+    
+    parser.set_defaults(func=None)
+    subparsers = parser.add_subparsers(dest='command', help='Core commands')
+    
+    if command is not None:
+        _PARSER_BUILDERS[command](subparsers)
+    else:
+        for builder in _PARSER_BUILDERS.values():
+            builder(subparsers)
+    
+    return parser
+
+
+def _sniff_subcommand(argv: list[str]) -> str | None:
+    """First positional token if it names a subcommand, else None"""
+    for arg in argv:
+        if arg in ('-h', '--help'):
+            # Root help lists every subcommand
+            return None
+        if not arg.startswith('-'):
+            return arg if arg in _PARSER_BUILDERS else None
+    return None
+
+
+def main():
+    """Main CLI entry point - North Star simplicity"""
+    # Only the invoked command's options are needed; build them all for help or bad input
+    parser = _build_parser(_sniff_subcommand(sys.argv[1:]))
     
     # Parse and dispatch
     args = parser.parse_args()
     
-    if not args.command:
-        print("🐍 uroboro - The Self-Documenting Content Pipeline")
-        print("🧪 EXPERIMENTAL BRANCH - Features being tested")
-        print("")
-        print("🎯 North Star Workflow (3 commands, that's it):")
-        print("  uro capture 'Fixed database timeout - cut query time from 3s to 200ms'")
-        print("  uro publish --blog")
-        print("  uro status")
-        print("")
-        print("🧪 Experimental features:")
-        print("  uro capture 'content' --qa 2  # Interactive follow-up questions")
-        print("")
-        print("Get acknowledged for your actual work. 🔥")
+    if args.func is None:
+        sys.stdout.write(_NO_COMMAND_BANNER)
         parser.print_help()
         return
     
-    # Sacred command dispatch
-    commands = {
-        'capture': cmd_capture,
-        'publish': cmd_publish,
-        'status': cmd_status,
-    }
-    
-    if args.command in commands:
-        try:
-            commands[args.command](args)
-        except KeyboardInterrupt:
-            print("\n👋 Interrupted by user")
-            sys.exit(1)
-        except Exception as e:
-            print(f"❌ Error: {e}")
-            if "--verbose" in sys.argv or "-v" in sys.argv:
-                import traceback
-                traceback.print_exc()
-            sys.exit(1)
-    else:
-        print(f"❌ Unknown command: {args.command}")
-        print("🎯 Valid commands: capture, publish, status")
+    # Sacred command dispatch - argparse already rejected unknown commands
+    verbose = getattr(args, 'verbose', False)
+    try:
+        args.func(args)
+    except KeyboardInterrupt:
+        print("\n👋 Interrupted by user")
+        sys.exit(1)
+    except Exception as e:
+        _error(f"❌ Error: {e}")
+        if verbose:
+            import traceback
+            traceback.print_exc()
         sys.exit(1)
 
 
@@ -4,17 +4,24 @@ Git Integration for uroboro
 Automatically captures development insights from git commits
 """
 
+from __future__ import annotations
+
+import heapq
 import subprocess
 import json
 import os
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Any
 
 
 class GitIntegration:
     def __init__(self, repo_path: str = "."):
         self.repo_path = Path(repo_path)
+        self._hooks_dir = os.path.normpath(os.path.join(repo_path, ".git", "hooks"))
         self.is_git_repo = self._check_git_repo()
     
     def _check_git_repo(self) -> bool:
@@ -31,7 +38,7 @@ class GitIntegration:
         except (subprocess.CalledProcessError, FileNotFoundError):
             return False
     
-    def get_recent_commits(self, days: int = 7, author: Optional[str] = None) -> List[Dict]:
+    def get_recent_commits(self, days: int = 7, author: str | None = None) -> list[dict[str, Any]]:
         """Get recent commits with details"""
         if not self.is_git_repo:
             return []
@@ -95,7 +102,7 @@ class GitIntegration:
         except subprocess.CalledProcessError:
             return ""
     
-    def get_changed_files(self, commit_hash: str) -> List[str]:
+    def get_changed_files(self, commit_hash: str) -> list[str]:
         """Get list of files changed in a commit"""
         if not self.is_git_repo:
             return []
@@ -112,7 +119,7 @@ class GitIntegration:
         except subprocess.CalledProcessError:
             return []
     
-    def analyze_commit_patterns(self, commits: List[Dict]) -> Dict:
+    def analyze_commit_patterns(self, commits: list[dict[str, Any]]) -> dict[str, Any]:
         """Analyze patterns in commit messages and changes"""
         if not commits:
             return {}
@@ -144,13 +151,13 @@ class GitIntegration:
         
         return {
             "total_commits": len(commits),
-            "message_keywords": dict(sorted(message_keywords.items(), key=lambda x: x[1], reverse=True)[:20]),
+            "message_keywords": dict(heapq.nlargest(20, message_keywords.items(), key=lambda x: x[1])),
             "file_changes": dict(sorted(file_changes.items(), key=lambda x: x[1], reverse=True)),
             "commit_frequency": commit_frequency,
             "analysis_date": datetime.now().isoformat()
         }
     
-    def auto_capture_commits(self, days: int = 1, author: Optional[str] = None) -> List[str]:
+    def auto_capture_commits(self, days: int = 1, author: str | None = None) -> list[str]:
         """Automatically capture recent commits as uroboro insights"""
         commits = self.get_recent_commits(days, author)
         captured_files = []
@@ -193,8 +200,7 @@ class GitIntegration:
         if not self.is_git_repo:
             return False
         
-        hooks_dir = self.repo_path / ".git" / "hooks"
-        hook_file = hooks_dir / hook_type
+        hook_file = os.path.join(self._hooks_dir, hook_type)
         
         # Create hook script content
         hook_content = f"""#!/bin/bash
@@ -234,24 +240,26 @@ fi
         if not self.is_git_repo:
             return False
         
-        hooks_dir = self.repo_path / ".git" / "hooks"
-        hook_file = hooks_dir / hook_type
+        hook_file = os.path.join(self._hooks_dir, hook_type)
         
         try:
-            if hook_file.exists():
-                # Check if it's our hook
-                with open(hook_file, 'r') as f:
-                    content = f.read()
-                
-                if "uroboro git integration" in content:
-                    hook_file.unlink()
-                    print(f"✅ Removed uroboro git hook: {hook_file}")
-                    return True
-                else:
-                    print(f"❌ Hook exists but not created by uroboro: {hook_file}")
-                    return False
+            # Check if it's our hook
+            with open(hook_file, 'rb') as f:
+                content = f.read()
+        except FileNotFoundError:
+            print(f"No hook found: {hook_file}")
+            return False
+        except Exception as e:
+            print(f"❌ Failed to remove git hook: {e}")
+            return False
+        
+        try:
+            if b"uroboro git integration" in content:
+                os.unlink(hook_file)
+                print(f"✅ Removed uroboro git hook: {hook_file}")
+                return True
             else:
-                print(f"No hook found: {hook_file}")
+                print(f"❌ Hook exists but not created by uroboro: {hook_file}")
                 return False
                 
         except Exception as e:
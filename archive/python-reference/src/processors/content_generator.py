@@ -1,12 +1,69 @@
+from __future__ import annotations
+
 import json
+import os
 import subprocess
 import re
+import sys
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Any
+
+# Import/ingest dumps can be large; encode straight to UTF-8 bytes with orjson when available
+try:
+    import orjson
+
+    def _dumps(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+except ImportError:
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+
+# Privacy filter keywords (things to skip or anonymize)
+_KNOWLEDGE_PRIVACY_KEYWORDS = (
+    "password", "secret", "private", "personal", "embarrassing",
+    "diary", "journal", "confession", "vent", "rant", "therapy",
+    "relationship", "dating", "crush", "anxiety", "depression"
+)
+
+_VAULT_PRIVACY_KEYWORDS = (
+    "private", "personal", "diary", "journal", "secret",
+    "password", "sensitive", "confidential", "vent", "rant"
+)
+
+# "1. " style list markers in LLM output
+_NUMBERED_ITEM_RE = re.compile(r"\d+\.\s+")
+
+# Characters not allowed in generated directory names
+_UNSAFE_NAME_RE = re.compile(r"[^\w\-]")
+
+
+# Tool/VCS directories never worth descending into when walking notes or dumps
+_SKIP_DIRS = frozenset({".git", ".hg", ".svn", ".obsidian", ".venv", "node_modules", "__pycache__"})
+
+
+def _walk_files(root: str | Path, suffixes: tuple[str, ...] | None = None):
+    """Yield files under root (optionally filtered by suffix) from one scandir per directory"""
+    stack = [os.fspath(root)]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in _SKIP_DIRS:
+                        stack.append(entry.path)
+                elif (suffixes is None or entry.name.endswith(suffixes)) and entry.is_file():
+                    yield Path(entry.path)
+
 
 class ContentGenerator:
-    def __init__(self, config: Dict = None):
+    def __init__(self, config: dict[str, Any] | None = None):
         self.config = config or {}
         # Load from aggregator config if available
         if not config:
@@ -20,7 +77,7 @@ class ContentGenerator:
         self.templates_dir = Path("templates")
         self.show_final_file = False  # Control flag for final file display
         
-    def set_show_final_file(self, enabled: bool = True):
+    def set_show_final_file(self, enabled: bool = True) -> None:
         """Enable or disable final file display"""
         self.show_final_file = enabled
     
@@ -32,27 +89,25 @@ class ContentGenerator:
         try:
             file_path = Path(file_path)
             if file_path.exists():
-                print(f"\n🔍 FINAL {content_type.upper()}: {file_path}")
-                print("=" * (len(str(file_path)) + len(content_type) + 15))
                 with open(file_path, 'r', encoding='utf-8') as f:
                     content = f.read()
-                print(content)
-                print("=" * (len(str(file_path)) + len(content_type) + 15))
-                print(f"📁 Saved to: {file_path.absolute()}\n")
+                rule = "=" * (len(str(file_path)) + len(content_type) + 15)
+                sys.stdout.write(
+                    f"\n🔍 FINAL {content_type.upper()}: {file_path}\n{rule}\n{content}\n{rule}\n"
+                    f"📁 Saved to: {file_path.absolute()}\n\n"
+                )
             else:
                 print(f"⚠️  Final file not found: {file_path}")
         except Exception as e:
             print(f"❌ Error displaying final file: {e}")
     
-    def enhanced_preview_content(self, content: str, content_type: str = "content", file_path: str = None) -> None:
+    def enhanced_preview_content(self, content: str, content_type: str = "content", file_path: str | None = None) -> None:
         """Enhanced preview with optional final file display"""
-        print(f"\n--- {content_type.upper()} PREVIEW ---")
-        if file_path:
-            print(f"📄 Will be saved to: {file_path}")
-        print("-" * 50)
-        print(content)
-        print("-" * 50)
-        print(f"--- END {content_type.upper()} PREVIEW ---\n")
+        # One write for the whole block instead of a flush per line on a TTY
+        label = content_type.upper()
+        saved_to = f"📄 Will be saved to: {file_path}\n" if file_path else ""
+        rule = "-" * 50
+        sys.stdout.write(f"\n--- {label} PREVIEW ---\n{saved_to}{rule}\n{content}\n{rule}\n--- END {label} PREVIEW ---\n\n")
         
         # Show final file if enabled and path provided
         if file_path and self.show_final_file:
@@ -63,7 +118,7 @@ class ContentGenerator:
             except KeyboardInterrupt:
                 print("\n⏭️  Skipping final file display")
     
-    def _call_ollama(self, prompt: str, model: str = None) -> str:
+    def _call_ollama(self, prompt: str, model: str | None = None) -> str:
         """Call Ollama to generate content"""
         model = model or self.llm_model
         
@@ -87,7 +142,7 @@ class ContentGenerator:
             print(f"[DEBUG] Ollama exception: {e}")
             return f"Error calling LLM: {str(e)}"
     
-    def generate_devlog_summary(self, activity_data: Dict) -> str:
+    def generate_devlog_summary(self, activity_data: dict[str, Any]) -> str:
         """Generate a development log summary from aggregated activity"""
         
         # PRIORITY 1: Extract daily notes FIRST (most recent captures)
@@ -130,7 +185,7 @@ class ContentGenerator:
         
         return self._call_ollama(prompt)
     
-    def generate_blog_post(self, activity_data: Dict, title: str = None, tags: List[str] = None, format: str = "mdx", voice: str = None) -> str:
+    def generate_blog_post(self, activity_data: dict[str, Any], title: str | None = None, tags: list[str] | None = None, format: str = "mdx", voice: str | None = None) -> str:
         """Generate a blog post from aggregated activity data"""
         
         # Get style configuration
@@ -165,8 +220,9 @@ class ContentGenerator:
         # Build focused content summary  
         today_work = "\n".join(daily_captures[:5]) if daily_captures else "No recent captures found"
         
+        today = datetime.now().strftime('%B %d, %Y')
         if not title:
-            title = f"Dev Update - {datetime.now().strftime('%B %d, %Y')}"
+            title = f"Dev Update - {today}"
         
         # Create focused prompt with today's work only
         prompt = f"""Write an engaging blog post about today's development work:
@@ -192,12 +248,12 @@ Keep it 200-300 words, focused on today's specific achievements."""
             return f"{frontmatter}\n\n{content}"
         elif format == "markdown":
             # Plain markdown with simple header
-            return f"# {title}\n\n*{datetime.now().strftime('%B %d, %Y')}*\n\n{content}"
+            return f"# {title}\n\n*{today}*\n\n{content}"
         else:
             # Plain text
-            return f"{title}\n{'=' * len(title)}\n{datetime.now().strftime('%B %d, %Y')}\n\n{content}"
+            return f"{title}\n{'=' * len(title)}\n{today}\n\n{content}"
     
-    def _generate_frontmatter(self, title: str, tags: List[str] = None) -> str:
+    def _generate_frontmatter(self, title: str, tags: list[str] | None = None) -> str:
         """Generate MDX frontmatter for qryzone blog"""
         
         if not tags:
@@ -213,7 +269,7 @@ tags: {json.dumps(tags)}
 excerpt: "Recent development progress and insights"
 ---"""
     
-    def save_blog_post(self, content: str, filename: str = None, output_dir: str = None, format: str = "markdown") -> str:
+    def save_blog_post(self, content: str, filename: str | None = None, output_dir: str | None = None, format: str = "markdown") -> str:
         """Save blog post to appropriate directory based on format"""
         
         if not filename:
@@ -240,8 +296,7 @@ excerpt: "Recent development progress and insights"
             html_content = self._markdown_to_html(content)
             content = html_content
         
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(content)
+        output_path.write_bytes(content.encode('utf-8'))
         
         # Display final file if enabled
         if self.show_final_file:
@@ -258,8 +313,7 @@ excerpt: "Recent development progress and insights"
         self.enhanced_preview_content(content, content_type, str(file_path))
         
         # Save the file
-        with open(file_path, 'w', encoding='utf-8') as f:
-            f.write(content)
+        file_path.write_bytes(content.encode('utf-8'))
         
         return str(file_path)
     
@@ -269,7 +323,7 @@ excerpt: "Recent development progress and insights"
         print(content)
         print(f"--- END {content_type.upper()} PREVIEW ---\n")
     
-    def create_social_hooks(self, activity_data: Dict, voice: str = None) -> List[str]:
+    def create_social_hooks(self, activity_data: dict[str, Any], voice: str | None = None) -> list[str]:
         """Generate social media hooks from activity"""
         
         # Get style configuration
@@ -338,13 +392,13 @@ excerpt: "Recent development progress and insights"
         hooks = []
         for line in response.split('\n'):
             line = line.strip()
-            if re.match(r'^\d+\.\s+', line):
-                hook = re.sub(r'^\d+\.\s+', '', line)
-                hooks.append(hook)
+            marker = _NUMBERED_ITEM_RE.match(line)
+            if marker:
+                hooks.append(line[marker.end():])
         
         return hooks
     
-    def mine_knowledge_base(self, notes_path: str = None, deep_analysis: bool = False, privacy_filter: bool = True) -> str:
+    def mine_knowledge_base(self, notes_path: str | None = None, deep_analysis: bool = False, privacy_filter: bool = True) -> str:
         """Mine the notes knowledge base for themes, insights, and patterns"""
         
         if not notes_path:
@@ -356,33 +410,16 @@ excerpt: "Recent development progress and insights"
         if not notes_path.exists():
             return "Error: Notes directory not found"
         
-        # Collect markdown files
-        md_files = list(notes_path.glob("*.md"))
-        txt_files = list(notes_path.glob("*.txt"))
-        
-        # For deep analysis, also recursively search subdirectories
+        # For deep analysis, recursively search subdirectories and other text-like files
         if deep_analysis:
-            md_files.extend(list(notes_path.rglob("*.md")))
-            txt_files.extend(list(notes_path.rglob("*.txt")))
-            # Also include other text-like files
-            other_files = list(notes_path.rglob("*.html"))
-            other_files.extend(list(notes_path.rglob("*.json")))
-            other_files.extend(list(notes_path.rglob("*.log")))
+            all_files = list(_walk_files(notes_path, (".md", ".txt", ".html", ".json", ".log")))
         else:
-            other_files = []
-        
-        all_files = md_files + txt_files + other_files
+            all_files = list(notes_path.glob("*.md"))
+            all_files.extend(notes_path.glob("*.txt"))
         
         if not all_files:
             return "Error: No markdown or text files found in notes directory"
         
-        # Privacy filter keywords (things to skip or anonymize)
-        privacy_keywords = [
-            "password", "secret", "private", "personal", "embarrassing", 
-            "diary", "journal", "confession", "vent", "rant", "therapy",
-            "relationship", "dating", "crush", "anxiety", "depression"
-        ] if privacy_filter else []
-        
         # Read and aggregate content
         knowledge_content = []
         file_summaries = []
@@ -395,9 +432,11 @@ excerpt: "Recent development progress and insights"
                     continue
                 
                 # Privacy filter check
-                if privacy_filter and any(keyword in content.lower() for keyword in privacy_keywords):
-                    file_summaries.append(f"- {file_path.name} (PRIVATE - {len(content)} chars)")
-                    continue
+                if privacy_filter:
+                    content_lower = content.lower()
+                    if any(keyword in content_lower for keyword in _KNOWLEDGE_PRIVACY_KEYWORDS):
+                        file_summaries.append(f"- {file_path.name} (PRIVATE - {len(content)} chars)")
+                        continue
                 
                 # Store full content for deep analysis
                 if deep_analysis:
@@ -535,7 +574,7 @@ excerpt: "Recent development progress and insights"
         
         return self._call_ollama(prompt)
     
-    def import_obsidian_vault(self, vault_path: str, output_dir: str = None, include_private: bool = False) -> Dict[str, Any]:
+    def import_obsidian_vault(self, vault_path: str, output_dir: str | None = None, include_private: bool = False) -> dict[str, Any]:
         """Import Obsidian vault structure and content for context building"""
         
         vault_path = Path(vault_path).expanduser()
@@ -548,6 +587,9 @@ excerpt: "Recent development progress and insights"
             output_dir = Path(output_dir)
         
         output_dir.mkdir(parents=True, exist_ok=True)
+        # One timestamp for the metadata and both output files of this import
+        now = datetime.now()
+        stamp = now.strftime('%Y%m%d-%H%M%S')
         
         # Check for Obsidian config
         obsidian_config = vault_path / ".obsidian"
@@ -558,19 +600,16 @@ excerpt: "Recent development progress and insights"
         print(f"⚙️  Obsidian config detected: {has_obsidian_config}")
         
         # Collect all markdown files
-        md_files = list(vault_path.rglob("*.md"))
+        md_files = list(_walk_files(vault_path, (".md",)))
         
         # Privacy filtering
-        privacy_keywords = [
-            "private", "personal", "diary", "journal", "secret",
-            "password", "sensitive", "confidential", "vent", "rant"
-        ] if not include_private else []
+        privacy_keywords = () if include_private else _VAULT_PRIVACY_KEYWORDS
         
         # Parse vault structure
         vault_data = {
             "metadata": {
                 "vault_path": str(vault_path),
-                "import_timestamp": datetime.now().isoformat(),
+                "import_timestamp": now.isoformat(),
                 "total_files": len(md_files),
                 "has_obsidian_config": has_obsidian_config
             },
@@ -589,10 +628,13 @@ excerpt: "Recent development progress and insights"
                 content = md_file.read_text(encoding='utf-8')
                 
                 # Privacy filtering
-                if privacy_keywords and any(keyword in content.lower() or keyword in md_file.name.lower() 
-                                         for keyword in privacy_keywords):
-                    skipped_files.append(str(md_file.relative_to(vault_path)))
-                    continue
+                if privacy_keywords:
+                    content_lower = content.lower()
+                    name_lower = md_file.name.lower()
+                    if any(keyword in content_lower or keyword in name_lower
+                           for keyword in privacy_keywords):
+                        skipped_files.append(str(md_file.relative_to(vault_path)))
+                        continue
                 
                 # Extract file metadata
                 file_info = self._parse_obsidian_file(md_file, content, vault_path)
@@ -628,19 +670,17 @@ excerpt: "Recent development progress and insights"
         vault_data["import_summary"] = summary
         
         # Save vault data
-        import_file = output_dir / f"vault-import-{datetime.now().strftime('%Y%m%d-%H%M%S')}.json"
-        with open(import_file, 'w', encoding='utf-8') as f:
-            json.dump(vault_data, f, indent=2, ensure_ascii=False)
+        import_file = output_dir / f"vault-import-{stamp}.json"
+        import_file.write_bytes(_dumps(vault_data))
         
         # Generate import report
         report = self._generate_vault_import_report(vault_data, processed_files, skipped_files)
-        report_file = output_dir / f"import-report-{datetime.now().strftime('%Y%m%d-%H%M%S')}.md"
+        report_file = output_dir / f"import-report-{stamp}.md"
         
         if self.show_final_file:
             self.save_content_with_preview(report, str(report_file), "import report")
         else:
-            with open(report_file, 'w', encoding='utf-8') as f:
-                f.write(report)
+            report_file.write_bytes(report.encode('utf-8'))
         
         print(f"✅ Vault import complete!")
         print(f"📊 Processed: {len(processed_files)} files")
@@ -655,7 +695,7 @@ excerpt: "Recent development progress and insights"
             "summary": summary
         }
     
-    def _parse_obsidian_file(self, file_path: Path, content: str, vault_root: Path) -> Dict[str, Any]:
+    def _parse_obsidian_file(self, file_path: Path, content: str, vault_root: Path) -> dict[str, Any]:
         """Parse individual Obsidian file for metadata"""
         
         lines = content.split('\n')
@@ -699,19 +739,19 @@ excerpt: "Recent development progress and insights"
         
         return file_info
     
-    def _extract_obsidian_links(self, content: str) -> List[str]:
+    def _extract_obsidian_links(self, content: str) -> list[str]:
         """Extract Obsidian-style links [[link]]"""
         import re
         links = re.findall(r'\[\[([^\]]+)\]\]', content)
         return [link.split('|')[0] for link in links]  # Remove display text
     
-    def _extract_obsidian_tags(self, content: str) -> List[str]:
+    def _extract_obsidian_tags(self, content: str) -> list[str]:
         """Extract Obsidian-style tags #tag"""
         import re
         tags = re.findall(r'#([a-zA-Z0-9_/-]+)', content)
         return tags
     
-    def _generate_vault_import_report(self, vault_data: Dict, processed_files: List[str], skipped_files: List[str]) -> str:
+    def _generate_vault_import_report(self, vault_data: dict[str, Any], processed_files: list[str], skipped_files: list[str]) -> str:
         """Generate a markdown report of the vault import"""
         
         metadata = vault_data["metadata"]
@@ -767,7 +807,7 @@ excerpt: "Recent development progress and insights"
         
         return report
     
-    def universal_ingest(self, source_path: str, output_dir: str = None, project_name: str = None) -> Dict[str, Any]:
+    def universal_ingest(self, source_path: str, output_dir: str | None = None, project_name: str | None = None) -> dict[str, Any]:
         """Universal file ingestion - the 'monkey dump stuff here' bucket"""
         
         source_path = Path(source_path).expanduser()
@@ -783,7 +823,8 @@ excerpt: "Recent development progress and insights"
             project_name = source_path.name if source_path.is_dir() else source_path.stem
             
         # Create organized output structure
-        ingest_dir = output_dir / f"ingest-{project_name}-{datetime.now().strftime('%Y%m%d-%H%M%S')}"
+        now = datetime.now()
+        ingest_dir = output_dir / f"ingest-{_UNSAFE_NAME_RE.sub('', project_name)}-{now.strftime('%Y%m%d-%H%M%S')}"
         ingest_dir.mkdir(parents=True, exist_ok=True)
         
         print(f"🐒 MONKEY DUMP MODE: Ingesting everything from {source_path}")
@@ -793,10 +834,7 @@ excerpt: "Recent development progress and insights"
         if source_path.is_file():
             all_files = [source_path]
         else:
-            all_files = []
-            for pattern in ["**/*"]:
-                all_files.extend(source_path.glob(pattern))
-            all_files = [f for f in all_files if f.is_file()]
+            all_files = list(_walk_files(source_path))
         
         print(f"🔍 Found {len(all_files)} files to process")
         
@@ -805,7 +843,7 @@ excerpt: "Recent development progress and insights"
             "metadata": {
                 "source_path": str(source_path),
                 "project_name": project_name,
-                "ingest_timestamp": datetime.now().isoformat(),
+                "ingest_timestamp": now.isoformat(),
                 "total_files_found": len(all_files)
             },
             "processed_files": {},
@@ -870,8 +908,7 @@ excerpt: "Recent development progress and insights"
         
         # Save ingestion data
         data_file = ingest_dir / "ingestion-data.json"
-        with open(data_file, 'w', encoding='utf-8') as f:
-            json.dump(ingest_data, f, indent=2, ensure_ascii=False)
+        data_file.write_bytes(_dumps(ingest_data))
         
         # Generate ingestion report
         report = self._generate_ingestion_report(ingest_data)
@@ -880,8 +917,7 @@ excerpt: "Recent development progress and insights"
         if self.show_final_file:
             self.save_content_with_preview(report, str(report_file), "ingestion report")
         else:
-            with open(report_file, 'w', encoding='utf-8') as f:
-                f.write(report)
+            report_file.write_bytes(report.encode('utf-8'))
         
         print(f"\n✅ Universal ingestion complete!")
         print(f"📊 Processed: {processed_count} files")
@@ -896,7 +932,7 @@ excerpt: "Recent development progress and insights"
             "summary": summary
         }
     
-    def _analyze_and_ingest_file(self, file_path: Path, source_root: Path, output_dir: Path) -> Dict[str, Any]:
+    def _analyze_and_ingest_file(self, file_path: Path, source_root: Path, output_dir: Path) -> dict[str, Any]:
         """Analyze and ingest a single file with smart parsing"""
         
         file_info = {
@@ -958,7 +994,7 @@ excerpt: "Recent development progress and insights"
         
         return file_info
     
-    def _parse_markdown_file(self, file_path: Path) -> Dict[str, Any]:
+    def _parse_markdown_file(self, file_path: Path) -> dict[str, Any]:
         """Parse markdown file for content and structure"""
         try:
             content = file_path.read_text(encoding='utf-8')
@@ -1007,7 +1043,7 @@ excerpt: "Recent development progress and insights"
         except Exception as e:
             return {"parsing_error": str(e)}
     
-    def _parse_text_file(self, file_path: Path) -> Dict[str, Any]:
+    def _parse_text_file(self, file_path: Path) -> dict[str, Any]:
         """Parse plain text file"""
         try:
             content = file_path.read_text(encoding='utf-8')
@@ -1022,7 +1058,7 @@ excerpt: "Recent development progress and insights"
         except Exception as e:
             return {"parsing_error": str(e)}
     
-    def _parse_data_file(self, file_path: Path) -> Dict[str, Any]:
+    def _parse_data_file(self, file_path: Path) -> dict[str, Any]:
         """Parse CSV/TSV and other data files"""
         try:
             import csv
@@ -1057,7 +1093,7 @@ excerpt: "Recent development progress and insights"
         except Exception as e:
             return {"parsing_error": str(e)}
     
-    def _parse_structured_file(self, file_path: Path) -> Dict[str, Any]:
+    def _parse_structured_file(self, file_path: Path) -> dict[str, Any]:
         """Parse JSON/YAML files"""
         try:
             content = file_path.read_text(encoding='utf-8')
@@ -1083,7 +1119,7 @@ excerpt: "Recent development progress and insights"
         except Exception as e:
             return {"parsing_error": str(e)}
     
-    def _parse_image_file(self, file_path: Path) -> Dict[str, Any]:
+    def _parse_image_file(self, file_path: Path) -> dict[str, Any]:
         """Parse image files (basic metadata)"""
         try:
             # Basic image info - would need PIL/Pillow for dimensions
@@ -1095,7 +1131,7 @@ excerpt: "Recent development progress and insights"
         except Exception as e:
             return {"parsing_error": str(e)}
     
-    def _parse_document_file(self, file_path: Path) -> Dict[str, Any]:
+    def _parse_document_file(self, file_path: Path) -> dict[str, Any]:
         """Parse document files (PDF, Word, etc.)"""
         return {
             "document_type": file_path.suffix.lower(),
@@ -1103,7 +1139,7 @@ excerpt: "Recent development progress and insights"
             "parsing_notes": "Document detected - would need specialized libraries for content extraction"
         }
     
-    def _parse_design_file(self, file_path: Path) -> Dict[str, Any]:
+    def _parse_design_file(self, file_path: Path) -> dict[str, Any]:
         """Parse design files (Figma, Sketch, etc.)"""
         return {
             "design_type": file_path.suffix.lower(),
@@ -1111,7 +1147,7 @@ excerpt: "Recent development progress and insights"
             "parsing_notes": "Design file detected - Figma API integration planned for future versions"
         }
     
-    def _parse_code_file(self, file_path: Path) -> Dict[str, Any]:
+    def _parse_code_file(self, file_path: Path) -> dict[str, Any]:
         """Parse code files"""
         try:
             content = file_path.read_text(encoding='utf-8')
@@ -1127,7 +1163,7 @@ excerpt: "Recent development progress and insights"
         except Exception as e:
             return {"parsing_error": str(e)}
     
-    def _generate_ingestion_report(self, ingest_data: Dict) -> str:
+    def _generate_ingestion_report(self, ingest_data: dict[str, Any]) -> str:
         """Generate a comprehensive ingestion report"""
         
         metadata = ingest_data["metadata"]
@@ -1252,4 +1288,15 @@ excerpt: "Recent development progress and insights"
 </body>
 </html>"""
         
-        return html 
\ No newline at end of file
+        return html 
+
+
+_default_generator: ContentGenerator | None = None
+
+
+def get_default_generator() -> ContentGenerator:
+    """Shared ContentGenerator built from the default config on first use"""
+    global _default_generator
+    if _default_generator is None:
+        _default_generator = ContentGenerator()
+    return _default_generator